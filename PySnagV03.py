@@ -2,8 +2,16 @@ import sys
 import os
 import subprocess
 import configparser
+import asyncio
+import json
+import re
 import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timedelta
+from functools import partial
 
 # Read config.ini for ffmpeg configuration and update PATH if necessary
 config = configparser.ConfigParser()
@@ -15,29 +23,345 @@ if 'FFmpeg' in config and config['FFmpeg'].get('path'):
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLineEdit, QListWidget, QFileDialog, QProgressBar, QLabel, QMessageBox,
-    QInputDialog, QMenu, QTabWidget, QSpacerItem, QSizePolicy, QDialog, QComboBox
+    QLineEdit, QListWidget, QListView, QFileDialog, QProgressBar, QLabel, QMessageBox,
+    QInputDialog, QMenu, QTabWidget, QSpacerItem, QSizePolicy, QDialog, QComboBox,
+    QCheckBox, QDialogButtonBox
+)
+from PyQt5.QtCore import (
+    QThread, QThreadPool, QRunnable, QObject, pyqtSignal, QSettings, Qt, QSize,
+    QStringListModel, QTimer
 )
-from PyQt5.QtCore import QThread, pyqtSignal, QSettings, Qt, QSize
 from PyQt5.QtGui import QPalette, QColor
 
 import yt_dlp
 
 # ---------------------------
-# Helper Function: Get Video Resolution
+# Helper Function: Run ffmpeg/ffprobe Queries
 # ---------------------------
-def get_video_resolution(filename):
-    """Get the height (in pixels) of the first video stream using ffprobe."""
+# Resolved once after config.ini has extended PATH; absolute paths skip the PATH search on each spawn
+_FFMPEG_PATH = shutil.which("ffmpeg")
+_FFPROBE_PATH = shutil.which("ffprobe")
+
+# A minimal environment block and no console window make each spawn cheaper on Windows
+_TOOL_ENV = {'PATH': os.environ.get('PATH', ''), 'SystemRoot': os.environ.get('SystemRoot', '')}
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform.startswith('win') else 0
+# Fully detached children (e.g. explorer) inherit no handles and never hold up the UI thread
+_DETACHED = (subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+             if sys.platform.startswith('win') else 0)
+
+def run_tool(cmd, timeout=5):
+    """Run a short ffmpeg/ffprobe query and return its stdout as text."""
+    result = subprocess.run(cmd, capture_output=True, timeout=timeout,
+                            env=_TOOL_ENV, creationflags=_NO_WINDOW)
+    return result.stdout.decode('ascii', 'ignore').strip()
+
+# ---------------------------
+# Helper Functions: ffprobe Metadata
+# ---------------------------
+# filename -> (mtime, size, probe result); reused only while mtime and size still match.
+# Least recently used first; probe_many fills it from worker threads, hence the lock.
+PROBE_CACHE_SIZE = 512
+_probe_cache = OrderedDict()
+_probe_cache_lock = threading.Lock()
+
+def _cache_probe(filename, entry):
+    with _probe_cache_lock:
+        _probe_cache[filename] = entry
+        _probe_cache.move_to_end(filename)
+        while len(_probe_cache) > PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+
+# Header-only probe: read at most 32 KB and skip stream analysis (no frame decode)
+_FAST_PROBE_ARGS = ["-probesize", "32k", "-analyzeduration", "0", "-fflags", "+nobuffer"]
+# Fallback for containers without a usable header, e.g. MPEG-TS
+_FULL_PROBE_ARGS = ["-probesize", "5M"]
+
+def _probe_video(filename):
+    """
+    Run ffprobe for the video height, container duration and the codecs of
+    the first video and audio streams. A cheap header-only probe is tried
+    first; the slower probe only runs if it finds no streams or duration.
+    """
+    result = _run_probe(filename, _FAST_PROBE_ARGS)
+    if result[1] is None or (result[2] is None and result[3] is None):
+        result = _run_probe(filename, _FULL_PROBE_ARGS)
+    return result
+
+def _run_probe(filename, probe_args):
+    height = duration = video_codec = audio_codec = None
     try:
-        result = subprocess.run(
-            ["ffprobe", "-v", "error", "-select_streams", "v:0",
-             "-show_entries", "stream=height", "-of", "csv=p=0", filename],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        output = run_tool(
+            [_FFPROBE_PATH or "ffprobe", "-v", "error", *probe_args,
+             "-show_entries", "stream=codec_type,codec_name,height:format=duration",
+             "-of", "json", filename]
         )
-        res = result.stdout.strip()
-        return int(res) if res.isdigit() else None
+        info = json.loads(output or "{}")
+        for stream in info.get("streams", []):
+            if stream.get("codec_type") == "video" and video_codec is None:
+                video_codec = stream.get("codec_name")
+                height = stream.get("height")
+            elif stream.get("codec_type") == "audio" and audio_codec is None:
+                audio_codec = stream.get("codec_name")
+        try:
+            duration = float(info.get("format", {}).get("duration"))
+        except (TypeError, ValueError):
+            pass
     except Exception:
+        pass
+    return height, duration, video_codec, audio_codec
+
+def probe_video(filename, st=None):
+    """
+    Return (height, duration, video_codec, audio_codec) for filename,
+    reusing cached ffprobe results. Unknown values are None.
+    st: an os.stat result the caller already has for filename.
+    """
+    if st is None:
+        try:
+            st = os.stat(filename)
+        except (OSError, TypeError):
+            return None, None, None, None
+    with _probe_cache_lock:
+        entry = _probe_cache.get(filename)
+        if entry is not None and entry[0] == st.st_mtime and entry[1] == st.st_size:
+            _probe_cache.move_to_end(filename)
+            return entry[2]
+    result = _probe_video(filename)
+    # A failed probe (no duration, e.g. ffprobe missing or timed out) is retried next time
+    if result[1] is not None:
+        _cache_probe(filename, (st.st_mtime, st.st_size, result))
+    return result
+
+def load_probe_cache(data):
+    """Seed the probe cache from a dict produced by export_probe_cache()."""
+    for filename, entry in data.items():
+        # Skip malformed or failed (no duration) entries one by one
+        try:
+            mtime, size, result = entry
+            result = tuple(result)
+        except (TypeError, ValueError):
+            continue
+        if len(result) != 4 or result[1] is None:
+            continue
+        if filename not in _probe_cache:
+            _cache_probe(filename, (mtime, size, result))
+
+def export_probe_cache(filenames):
+    """Return the cached probe entries for filenames as a JSON-serialisable dict."""
+    with _probe_cache_lock:
+        return {f: _probe_cache[f] for f in filenames if f in _probe_cache}
+
+def probe_many(filenames, max_workers=None):
+    """
+    Probe several files in parallel and return {filename: probe_video(filename)}.
+    Results land in the probe_video cache, so later lookups are free.
+    max_workers caps concurrent ffprobe processes (default: CPU count).
+    """
+    filenames = list(dict.fromkeys(filenames))
+    if not filenames:
+        return {}
+    max_workers = max_workers or os.cpu_count() or 4
+    with ThreadPoolExecutor(max_workers=min(len(filenames), max_workers)) as pool:
+        return dict(zip(filenames, pool.map(probe_video, filenames)))
+
+def get_video_resolution(filename):
+    """Get the height (in pixels) of the first video stream using ffprobe."""
+    return probe_video(filename)[0]
+
+# ---------------------------
+# Audio Output Formats
+# ---------------------------
+# Output format -> extra ffmpeg arguments and output file suffix; {bitrate} is in kbps
+AUDIO_CMD_TEMPLATES = {
+    "mp3": ["-b:a", "{bitrate}k"],
+    "wav": [],
+    "aiff": ["-c:a", "pcm_s16le"],
+    "flac": ["-c:a", "flac"],
+}
+AUDIO_EXT = {
+    "mp3": "_{bitrate}kbps.mp3",
+    "wav": ".wav",
+    "aiff": ".aiff",
+    "flac": ".flac",
+}
+
+# ---------------------------
+# Stream Copy Compatibility
+# ---------------------------
+# Output container -> source codecs that can be remuxed into it without re-encoding
+VIDEO_COPY_CODECS = {
+    "mp4": {"h264", "hevc", "av1", "mpeg4"},
+    "mov": {"h264", "hevc", "mpeg4", "prores"},
+    "mkv": {"h264", "hevc", "av1", "vp8", "vp9", "mpeg4"},
+    "webm": {"vp8", "vp9", "av1"},
+    "avi": {"mpeg4", "h264", "mjpeg"},
+}
+AUDIO_COPY_CODECS = {
+    "mp4": {"aac", "mp3", "alac", "ac3"},
+    "mov": {"aac", "mp3", "alac", "pcm_s16le"},
+    "mkv": {"aac", "mp3", "opus", "vorbis", "flac", "ac3"},
+    "webm": {"opus", "vorbis"},
+    "avi": {"mp3", "ac3", "pcm_s16le"},
+    # Audio-only outputs
+    "wav": {"pcm_s16le"},
+    "flac": {"flac"},
+}
+
+# ---------------------------
+# Accepted File Types
+# ---------------------------
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mkv', '.webm', '.mov'})
+_AUDIO_EXTS = frozenset({'.mp3', '.wav', '.aiff', '.flac'})
+
+IMPORT_FILE_FILTER = "Video Files ({});;Audio Files ({})".format(
+    " ".join("*" + ext for ext in sorted(_VIDEO_EXTS)),
+    " ".join("*" + ext for ext in sorted(_AUDIO_EXTS)))
+
+def is_video_file(path):
+    return os.path.splitext(path)[1].lower() in _VIDEO_EXTS
+
+# ---------------------------
+# Helper Function: NVENC Detection
+# ---------------------------
+# Output container -> NVENC encoder used in performance mode
+NVENC_CODECS = {"mp4": "h264_nvenc", "mkv": "hevc_nvenc"}
+# Source codecs every NVENC-capable GPU can also decode; others (AV1, VP9) may need the CPU
+NVDEC_CODECS = frozenset({"h264", "hevc"})
+
+def _cached_encoders():
+    """
+    Return the encoder list setup.py stored in config.ini, or None if it is
+    absent, was probed from a different ffmpeg, or is older than the binary.
+    """
+    section = config['FFmpeg'] if 'FFmpeg' in config else {}
+    encoders = section.get('encoders')
+    executable = section.get('executable')
+    if encoders is None or not executable or not _FFMPEG_PATH:
+        return None
+    if os.path.normcase(executable) != os.path.normcase(os.path.abspath(_FFMPEG_PATH)):
+        return None
+    try:
+        if os.path.getmtime('config.ini') < os.path.getmtime(_FFMPEG_PATH):
+            return None
+    except OSError:
         return None
+    return encoders
+
+def detect_nvenc():
+    """Return True if the ffmpeg build on PATH lists any NVENC encoder."""
+    encoders = _cached_encoders()
+    if encoders is not None:
+        return "nvenc" in encoders
+    try:
+        return "nvenc" in run_tool([_FFMPEG_PATH or "ffmpeg", "-hide_banner", "-encoders"])
+    except Exception:
+        return False
+
+NVENC_AVAILABLE = detect_nvenc()
+
+# encoder name -> whether a trial encode succeeded; filled lazily by nvenc_works
+_nvenc_trials = {}
+_nvenc_lock = threading.Lock()
+
+def nvenc_works(encoder):
+    """
+    Return True if encoder can actually encode a frame on this machine.
+    Builds list NVENC encoders even without an NVIDIA GPU, so the listing alone
+    is not enough; the one-frame trial runs once per encoder and is remembered.
+    """
+    with _nvenc_lock:
+        if encoder not in _nvenc_trials:
+            try:
+                result = subprocess.run(
+                    [_FFMPEG_PATH or "ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+                     "-i", "nullsrc", "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"],
+                    capture_output=True, timeout=10, env=_TOOL_ENV, creationflags=_NO_WINDOW)
+                _nvenc_trials[encoder] = result.returncode == 0
+            except Exception:
+                _nvenc_trials[encoder] = False
+        return _nvenc_trials[encoder]
+
+# ---------------------------
+# ConversionParamsDialog: All conversion choices in one window
+# ---------------------------
+class ConversionParamsDialog(QDialog):
+    AUDIO_FORMATS = ["MP3", "WAV", "AIFF", "FLAC"]
+    VIDEO_FORMATS = ["MP4", "AVI", "MKV", "WEBM", "MOV"]
+    MP3_BITRATES = ["320", "256", "128"]
+    # Available resolution options with numeric mapping
+    RESOLUTIONS = {"1080p": "1080", "2K": "1440", "4K": "2160"}
+    # Conversion type remembered by "apply to all"; reused without showing the dialog
+    last_choice = None
+
+    def __init__(self, parent, source_res=None):
+        """
+        source_res: height of the input video, if known. Higher target
+        resolutions get " (UPSCALED)" appended and the prompt shows the source.
+        """
+        super().__init__(parent)
+        self.source_res = source_res
+        self.setWindowTitle("Select Conversion Parameters")
+        layout = QVBoxLayout(self)
+
+        layout.addWidget(QLabel("Category:"))
+        self.category_combo = QComboBox()
+        self.category_combo.addItems(["Audio", "Video"])
+        layout.addWidget(self.category_combo)
+
+        layout.addWidget(QLabel("Format:"))
+        self.format_combo = QComboBox()
+        layout.addWidget(self.format_combo)
+
+        self.option_label = QLabel()
+        layout.addWidget(self.option_label)
+        self.option_combo = QComboBox()
+        layout.addWidget(self.option_combo)
+
+        self.apply_all_check = QCheckBox("Use for all conversions this session (hold Shift to choose again)")
+        layout.addWidget(self.apply_all_check)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.category_combo.currentTextChanged.connect(self.update_formats)
+        self.format_combo.currentTextChanged.connect(self.update_options)
+        self.update_formats(self.category_combo.currentText())
+
+    def update_formats(self, category):
+        self.format_combo.blockSignals(True)
+        self.format_combo.clear()
+        self.format_combo.addItems(self.AUDIO_FORMATS if category == "Audio" else self.VIDEO_FORMATS)
+        self.format_combo.blockSignals(False)
+        self.update_options()
+
+    def update_options(self, _=None):
+        self.option_combo.clear()
+        if self.category_combo.currentText() == "Audio":
+            self.option_label.setText("Bitrate (kbps):")
+            is_mp3 = self.format_combo.currentText() == "MP3"
+            if is_mp3:
+                self.option_combo.addItems(self.MP3_BITRATES)
+            self.option_combo.setEnabled(is_mp3)
+        else:
+            # Show the source resolution in the prompt if available
+            self.option_label.setText(f"Resolution (source: {self.source_res}p)" if self.source_res else "Resolution:")
+            for disp, num in self.RESOLUTIONS.items():
+                if self.source_res is not None and int(num) > self.source_res:
+                    self.option_combo.addItem(f"{disp} (UPSCALED)")
+                else:
+                    self.option_combo.addItem(disp)
+            self.option_combo.setEnabled(True)
+
+    def conversion_type(self):
+        fmt = self.format_combo.currentText()
+        if self.category_combo.currentText() == "Audio":
+            if fmt == "MP3":
+                return f"audio:{fmt}:{self.option_combo.currentText()}"
+            return f"audio:{fmt}"
+        resolution = self.option_combo.currentText().replace(" (UPSCALED)", "")
+        return f"video:{fmt}:{self.RESOLUTIONS[resolution]}"
 
 # ---------------------------
 # Helper Function: Conversion Parameter Selection
@@ -45,274 +369,490 @@ def get_video_resolution(filename):
 def choose_conversion_parameters(parent, input_file=None):
     """
     Presents a dialog to choose conversion parameters.
-    If a valid input_file is provided for video conversion, the function detects
-    the source resolution and appends " (UPSCALED)" to higher target resolution options.
-    Also, it updates the resolution prompt to display the source resolution.
+    If a valid input_file is provided, the dialog detects the source resolution
+    and marks higher video target resolutions as upscaled.
+    If "apply to all" was ticked earlier, the remembered choice is returned
+    without showing the dialog, unless Shift is held.
+    Returns (conversion_type, source_resolution); conversion_type is None if
+    the dialog was cancelled and source_resolution is None if not probed.
     """
-    category, ok = QInputDialog.getItem(parent, "Select Conversion Category", "Category:", ["Audio", "Video"], 0, False)
-    if not ok:
-        return None
-    if category == "Audio":
-        audio_format, ok = QInputDialog.getItem(parent, "Select Audio Format", "Format:", ["MP3", "WAV", "AIFF", "FLAC"], 0, False)
-        if not ok:
-            return None
-        if audio_format == "MP3":
-            bitrate, ok = QInputDialog.getItem(parent, "Select Audio Quality", "Bitrate (kbps):", ["320", "256", "128"], 0, False)
-            if not ok:
-                return None
-            conv_type = f"audio:{audio_format}:{bitrate}"
+    shift_held = QApplication.keyboardModifiers() & Qt.ShiftModifier
+    if ConversionParamsDialog.last_choice and not shift_held:
+        return ConversionParamsDialog.last_choice, None
+    # probe_video returns None values for missing files, so no separate exists check
+    source_res = get_video_resolution(input_file) if input_file else None
+    dialog = ConversionParamsDialog(parent, source_res)
+    if dialog.exec_() != QDialog.Accepted:
+        return None, source_res
+    conv_type = dialog.conversion_type()
+    ConversionParamsDialog.last_choice = conv_type if dialog.apply_all_check.isChecked() else None
+    return conv_type, source_res
+
+# ---------------------------
+# Helper Functions: ffmpeg Conversion
+# ---------------------------
+def build_conversion_command(input_file, conversion_type, performance_mode=False, force_copy=False, probe=None):
+    """
+    Build the ffmpeg command for a conversion and return (cmd, output_file).
+    See ConversionTask for the conversion_type format. probe is a
+    probe_video() result for input_file and is looked up if omitted.
+    Raises ValueError for unsupported or incomplete conversion types.
+    """
+    if probe is None:
+        probe = probe_video(input_file)
+    source_resolution, _, video_codec, audio_codec = probe
+    parts = conversion_type.split(":")
+    if len(parts) < 2:
+        raise ValueError("Unsupported conversion type format.")
+
+    media_type = parts[0].lower()  # "audio" or "video"
+    fmt = parts[1].lower()         # output format
+    output_file = os.path.splitext(input_file)[0]
+    cmd = [_FFMPEG_PATH or 'ffmpeg', '-y', '-nostats', '-loglevel', 'error', '-progress', 'pipe:1', '-i', input_file]
+
+    if media_type == "audio":
+        cmd.append("-vn")
+        if fmt == "mp3" and len(parts) < 3:
+            raise ValueError("Bitrate not specified for MP3 conversion.")
+        bitrate = parts[2] if len(parts) > 2 else ""
+        output_file += AUDIO_EXT.get(fmt, f'.{fmt}').format(bitrate=bitrate)
+        if audio_codec in AUDIO_COPY_CODECS.get(fmt, ()):
+            cmd.extend(['-c:a', 'copy'])
         else:
-            conv_type = f"audio:{audio_format}"
-    else:  # Video
-        video_format, ok = QInputDialog.getItem(parent, "Select Video Format", "Format:", ["MP4", "AVI", "MKV", "WEBM", "MOV"], 0, False)
-        if not ok:
-            return None
-        # Define available resolution options with numeric mapping
-        resolutions = {"1080p": "1080", "2K": "1440", "4K": "2160"}
-        source_res = get_video_resolution(input_file) if input_file and os.path.exists(input_file) else None
-        resolution_options = []
-        for disp, num in resolutions.items():
-            if source_res is not None and int(num) > source_res:
-                resolution_options.append(f"{disp} (UPSCALED)")
+            cmd.extend(fragment.format(bitrate=bitrate) for fragment in AUDIO_CMD_TEMPLATES.get(fmt, ()))
+    elif media_type == "video":
+        if len(parts) < 3:
+            raise ValueError("Resolution not specified for video conversion.")
+        target_resolution = parts[2]
+        same_resolution = bool(source_resolution) and int(target_resolution) == source_resolution
+        # Determine output file naming based on resolution comparison
+        if force_copy:
+            output_file += f' (STREAM COPY).{fmt}'
+        elif source_resolution:
+            if int(target_resolution) == source_resolution:
+                output_file += f' - {target_resolution}p (NO SCALING).{fmt}'
+            elif int(target_resolution) > source_resolution:
+                output_file += f' - {target_resolution}p (UPSCALED).{fmt}'
             else:
-                resolution_options.append(disp)
-        # Update the prompt to include the source resolution if available
-        prompt_text = f"Resolution (source: {source_res}p)" if source_res else "Resolution:"
-        resolution, ok = QInputDialog.getItem(parent, "Select Resolution", prompt_text, resolution_options, 0, False)
-        if not ok:
-            return None
-        resolution = resolution.replace(" (UPSCALED)", "")
-        numeric_resolution = resolutions[resolution]
-        conv_type = f"video:{video_format}:{numeric_resolution}"
-    return conv_type
+                output_file += f' - {target_resolution}p.{fmt}'
+        else:
+            output_file += f' - {target_resolution}p.{fmt}'
+
+        # Build ffmpeg command based on whether scaling is needed
+        if force_copy or (same_resolution and video_codec in VIDEO_COPY_CODECS.get(fmt, ())):
+            # Remux only: the source codec already fits the requested container
+            cmd.extend(['-c:v', 'copy'])
+            if force_copy or audio_codec in AUDIO_COPY_CODECS.get(fmt, ()):
+                cmd.extend(['-c:a', 'copy'])
+        elif performance_mode and fmt in NVENC_CODECS and NVENC_AVAILABLE and nvenc_works(NVENC_CODECS[fmt]):
+            if video_codec in NVDEC_CODECS:
+                # Decode, scale and encode on the GPU so frames never leave video memory
+                input_index = cmd.index('-i')
+                cmd[input_index:input_index] = ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda']
+                if not same_resolution:
+                    cmd.extend(['-vf', f'scale_cuda=-2:{target_resolution}'])
+            elif not same_resolution:
+                # CPU-decoded frames: scale in software, then hand them to NVENC
+                cmd.extend(['-vf', f'scale=-2:{target_resolution}:flags=lanczos'])
+            cmd.extend(["-c:v", NVENC_CODECS[fmt], "-preset", "fast"])
+        else:
+            if performance_mode:
+                # Let ffmpeg pick any available hardware decoder
+                input_index = cmd.index('-i')
+                cmd[input_index:input_index] = ['-hwaccel', 'auto']
+            if not same_resolution:
+                # Apply scaling with a high-quality Lanczos filter
+                cmd.extend(['-vf', f'scale=-2:{target_resolution}:flags=lanczos'])
+                if performance_mode:
+                    cmd.extend(["-filter_threads", str(os.cpu_count() or 1)])
+            if performance_mode:
+                cmd.extend(["-threads", "0"])
+    else:
+        raise ValueError("Unsupported media type.")
+
+    cmd.append(output_file)
+    return cmd, output_file
+
+# A -progress line is a bare key=value pair; anything else is ffmpeg's (merged) stderr
+_PROGRESS_LINE_RE = re.compile(rb'^\w+=')
+
+def _error_lines(data):
+    """Return the non-progress lines of ffmpeg output as text."""
+    return [line.decode('utf-8', 'replace') for line in (raw.strip() for raw in data.splitlines())
+            if line and not _PROGRESS_LINE_RE.match(line)]
+
+def _ffmpeg_priority_flags(performance_mode):
+    """Windows creation flags for a conversion's ffmpeg process; 0 elsewhere."""
+    if not sys.platform.startswith('win'):
+        return 0
+    priority = subprocess.HIGH_PRIORITY_CLASS if performance_mode else subprocess.BELOW_NORMAL_PRIORITY_CLASS
+    return priority | subprocess.CREATE_NO_WINDOW
+
+# Matches the microsecond position keys and the end marker of ffmpeg's -progress output
+_PROGRESS_RE = re.compile(rb'out_time_us=(\d+)|out_time_ms=(\d+)|progress=end')
+
+def parse_progress(data, total_us):
+    """
+    Parse complete lines of ffmpeg -progress output for a file lasting total_us
+    microseconds. Returns (updates, ended): a list of (percent, remaining
+    seconds) in stream order and whether progress=end was reached.
+    """
+    updates = []
+    for match in _PROGRESS_RE.finditer(data):
+        if match.lastindex is None:  # progress=end
+            return updates, True
+        current_us = int(match.group(match.lastindex))
+        updates.append((min(100, current_us * 100 // total_us), max(0, total_us - current_us) // 1000000))
+    return updates, False
+
+def run_ffmpeg(cmd, total_duration, progress_callback=None, performance_mode=False):
+    """
+    Run an ffmpeg command built with -progress pipe:1 and report progress.
+    progress_callback is called with (percent, remaining time string).
+    Raises RuntimeError with ffmpeg's error output if it exits non-zero.
+    ffmpeg runs above normal priority in performance mode and below it otherwise.
+    """
+    # Default block buffering and bytes mode: no per-line reads or locale decoding
+    process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, bufsize=-1,
+                               creationflags=_ffmpeg_priority_flags(performance_mode))
+    if not sys.platform.startswith('win'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, process.pid, -5 if performance_mode else 10)
+        except OSError:
+            pass  # Raising priority needs privileges; keep the default
+    total_us = max(1, int(total_duration * 1000000))
+    buffer = bytearray()
+    errors = []
+    last_percent = None
+    done = False
+    # Read to EOF: errors can still follow progress=end
+    while True:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            break
+        buffer += chunk
+        # Only scan complete lines; a trailing partial line waits for the next read
+        end = buffer.rfind(b"\n") + 1
+        if not end:
+            continue
+        lines = bytes(buffer[:end])
+        del buffer[:end]
+        errors.extend(_error_lines(lines))
+        if done:
+            continue
+        updates, done = parse_progress(lines, total_us)
+        for percent, remaining in updates:
+            if percent == last_percent:
+                continue
+            last_percent = percent
+            if progress_callback is not None:
+                progress_callback(percent, str(timedelta(seconds=remaining)))
+    errors.extend(_error_lines(bytes(buffer)))
+    returncode = process.wait()
+    if returncode != 0:
+        message = f"ffmpeg failed with exit code {returncode}."
+        if errors:
+            message += "\n" + "\n".join(errors[-10:])
+        raise RuntimeError(message)
+
+def convert_file(input_file, conversion_type, performance_mode=False, force_copy=False,
+                 progress_callback=None, source_resolution=None):
+    """
+    Convert input_file with ffmpeg and return the output path. Raises on failure.
+    source_resolution, if already known, is used instead of the probed height.
+    """
+    if _FFMPEG_PATH is None:
+        raise RuntimeError("ffmpeg executable not found in PATH.")
+    if not os.path.exists(input_file):
+        raise FileNotFoundError("Input file not found: " + input_file)
+    probe = probe_video(input_file)
+    if source_resolution is not None:
+        probe = (source_resolution,) + probe[1:]
+    total_duration = probe[1]
+    if total_duration is None:
+        raise RuntimeError("Could not determine input file duration.")
+    cmd, output_file = build_conversion_command(input_file, conversion_type, performance_mode, force_copy, probe)
+    run_ffmpeg(cmd, total_duration, progress_callback, performance_mode)
+    return output_file
 
 # ---------------------------
-# ConversionThread: ETA and status updates
+# ConversionTask: ETA and status updates, run on a QThreadPool
 # ---------------------------
-class ConversionThread(QThread):
+class ConversionSignals(QObject):
     progress_update = pyqtSignal(int, str)  # percent, remaining time
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
-    
-    def __init__(self, input_file, conversion_type, performance_mode=False):
+
+class ConversionTask(QRunnable):
+    def __init__(self, input_file, conversion_type, performance_mode=False, force_copy=False,
+                 source_resolution=None):
         """
         conversion_type format: "media:format[:parameter]"
         For video: "video:MP4:1080" (or AVI, MKV, WEBM, MOV)
         For audio: "audio:MP3:320" or "audio:WAV" (or AIFF, FLAC)
         performance_mode: Boolean flag to enable optimized ffmpeg parameters.
+        force_copy: Boolean flag to always remux video without re-encoding.
+        source_resolution: input height if already known, e.g. from
+        choose_conversion_parameters; probed when None.
+        QRunnable is not a QObject, so signals live on self.signals.
         """
         super().__init__()
+        # The caller keeps a reference until finished/error, so Python rather than the pool owns the task
+        self.setAutoDelete(False)
+        self.signals = ConversionSignals()
         self.input_file = input_file
         self.conversion_type = conversion_type
         self.performance_mode = performance_mode
+        self.force_copy = force_copy
+        self.source_resolution = source_resolution
+        self._last_emit_time = 0.0
+        self._last_emitted_percent = None
+
+    def _emit_progress(self, percent, remaining):
+        # Cap queued GUI updates at 4 Hz; the final 100% is always delivered
+        now = time.monotonic()
+        if percent == self._last_emitted_percent:
+            return
+        if percent < 100 and now - self._last_emit_time < 0.25:
+            return
+        self._last_emit_time = now
+        self._last_emitted_percent = percent
+        self.signals.progress_update.emit(percent, remaining)
 
-    def get_duration(self, filename):
+    def run(self):
         try:
-            result = subprocess.run(
-                ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                 "-of", "default=noprint_wrappers=1:nokey=1", filename],
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-            )
-            return float(result.stdout.strip())
-        except Exception:
-            return None
+            output_file = convert_file(self.input_file, self.conversion_type, self.performance_mode,
+                                       self.force_copy, self._emit_progress, self.source_resolution)
+            self.signals.finished.emit(output_file)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+# ---------------------------
+# BatchConversionThread: Several ffmpeg processes in parallel.
+# ---------------------------
+class BatchConversionThread(QThread):
+    file_finished = pyqtSignal(str, str)  # input file, output file
+    file_error = pyqtSignal(str, str)     # input file, error message
+    progress_update = pyqtSignal(int, int)  # files done, files total
+
+    def __init__(self, input_files, conversion_type, performance_mode=False, force_copy=False):
+        """
+        Converts every file in input_files with the same conversion_type.
+        Up to half the CPU count ffmpeg processes run at once; each one is
+        already multi-threaded, so more would only contend for cores.
+        """
+        super().__init__()
+        self.input_files = list(dict.fromkeys(input_files))
+        self.conversion_type = conversion_type
+        self.performance_mode = performance_mode
+        self.force_copy = force_copy
 
     def run(self):
-        if shutil.which("ffmpeg") is None:
-            self.error.emit("ffmpeg executable not found in PATH.")
-            return
-        if not os.path.exists(self.input_file):
-            self.error.emit("Input file not found: " + self.input_file)
+        total = len(self.input_files)
+        if not total:
             return
+        # Probe everything up front so workers start from a warm cache
+        probe_many(self.input_files)
+        workers = max(1, min(total, (os.cpu_count() or 2) // 2))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(convert_file, input_file, self.conversion_type,
+                            self.performance_mode, self.force_copy): input_file
+                for input_file in self.input_files
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                input_file = futures[future]
+                try:
+                    self.file_finished.emit(input_file, future.result())
+                except Exception as e:
+                    self.file_error.emit(input_file, str(e))
+                self.progress_update.emit(done, total)
 
-        total_duration = self.get_duration(self.input_file)
-        if total_duration is None:
-            self.error.emit("Could not determine input file duration.")
+# ---------------------------
+# Helper Function: yt_dlp Download
+# ---------------------------
+QUALITY_MAP = {
+    "4k": "bestvideo[height=2160]+bestaudio/best",
+    "2k": "bestvideo[height=1440]+bestaudio/best",
+    "1080p": "bestvideo[height=1080]+bestaudio/best",
+    "720p": "bestvideo[height=720]+bestaudio/best",
+    "480p": "bestvideo[height=480]+bestaudio/best"
+}
+
+def download_video(url, download_path, quality, progress_callback=None, stop_event=None):
+    """
+    Download url with yt_dlp and return the path of the renamed output file.
+    quality: for standard videos: "4k", "2k", "1080p", "720p", "480p"
+             for Shorts: use "Shorts"
+    progress_callback is called with an int percent. Raises on failure,
+    including when stop_event is set while the download is running.
+    """
+    ydl_opts = {
+        'outtmpl': os.path.join(download_path, '%(title)s.%(ext)s'),
+        'progress_hooks': [],
+    }
+    def progress_hook(d):
+        if stop_event is not None and stop_event.is_set():
+            raise RuntimeError("Download cancelled.")
+        if progress_callback is None:
             return
+        if d.get('status') == 'downloading':
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            downloaded = d.get('downloaded_bytes', 0)
+            if total:
+                percent = int(downloaded / total * 100)
+                progress_callback(percent)
+        elif d.get('status') == 'finished':
+            progress_callback(100)
+    ydl_opts['progress_hooks'].append(progress_hook)
+
+    if quality == "Shorts":
+        ydl_opts['format'] = 'bestvideo+bestaudio/best'
+    elif quality in QUALITY_MAP:
+        ydl_opts['format'] = QUALITY_MAP[quality]
+    else:
+        ydl_opts['format'] = 'bestvideo+bestaudio/best'
 
-        try:
-            parts = self.conversion_type.split(":")
-            if len(parts) < 2:
-                self.error.emit("Unsupported conversion type format.")
-                return
-
-            media_type = parts[0].lower()  # "audio" or "video"
-            fmt = parts[1].lower()         # output format
-            output_file = os.path.splitext(self.input_file)[0]
-            cmd = ['ffmpeg', '-y', '-i', self.input_file]
-            
-            if media_type == "audio":
-                cmd.append("-vn")
-                if fmt == "mp3":
-                    if len(parts) < 3:
-                        self.error.emit("Bitrate not specified for MP3 conversion.")
-                        return
-                    bitrate = parts[2]
-                    output_file += f'_{bitrate}kbps.mp3'
-                    cmd.extend(['-b:a', f'{bitrate}k'])
-                elif fmt == "wav":
-                    output_file += f'.{fmt}'
-                elif fmt == "aiff":
-                    output_file += f'.{fmt}'
-                    cmd.extend(['-c:a', 'pcm_s16le'])
-                elif fmt == "flac":
-                    output_file += f'.{fmt}'
-                    cmd.extend(['-c:a', 'flac'])
-                else:
-                    output_file += f'.{fmt}'
-            elif media_type == "video":
-                if len(parts) < 3:
-                    self.error.emit("Resolution not specified for video conversion.")
-                    return
-                target_resolution = parts[2]
-                source_resolution = get_video_resolution(self.input_file)
-                # Determine output file naming based on resolution comparison
-                if source_resolution:
-                    if int(target_resolution) == source_resolution:
-                        output_file += f' - {target_resolution}p (NO SCALING).{fmt}'
-                    elif int(target_resolution) > source_resolution:
-                        output_file += f' - {target_resolution}p (UPSCALED).{fmt}'
-                    else:
-                        output_file += f' - {target_resolution}p.{fmt}'
-                else:
-                    output_file += f' - {target_resolution}p.{fmt}'
-
-                # Build ffmpeg command based on whether scaling is needed
-                if source_resolution and int(target_resolution) == source_resolution:
-                    # Use stream copy to preserve quality when no scaling is needed
-                    cmd.extend(['-c:v', 'copy'])
-                else:
-                    # Apply scaling with a high-quality Lanczos filter
-                    cmd.extend(['-vf', f'scale=-2:{target_resolution}:flags=lanczos'])
-                    if self.performance_mode:
-                        if fmt == "mp4":
-                            cmd.extend(["-c:v", "h264_nvenc", "-preset", "fast"])
-                        else:
-                            cmd.extend(["-threads", "0"])
-            else:
-                self.error.emit("Unsupported media type.")
-                return
-
-            cmd.append(output_file)
-            cmd.extend(['-progress', 'pipe:1'])
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
-            current_time = 0.0
-            while True:
-                line = process.stdout.readline()
-                if not line:
-                    break
-                line = line.strip()
-                if line.startswith("out_time="):
-                    out_time_str = line.split("=")[1]
-                    try:
-                        h, m, s = out_time_str.split(":")
-                        seconds = float(h) * 3600 + float(m) * 60 + float(s)
-                    except Exception:
-                        seconds = 0.0
-                    current_time = seconds
-                    percent = int((current_time / total_duration) * 100)
-                    remaining = total_duration - current_time
-                    rem_td = timedelta(seconds=int(remaining))
-                    remaining_str = str(rem_td)
-                    self.progress_update.emit(percent, remaining_str)
-                elif line.startswith("out_time_ms="):
-                    ms_str = line.split("=")[1]
-                    try:
-                        seconds = float(ms_str) / 1000000.0
-                    except Exception:
-                        seconds = 0.0
-                    current_time = seconds
-                    percent = int((current_time / total_duration) * 100)
-                    remaining = total_duration - current_time
-                    rem_td = timedelta(seconds=int(remaining))
-                    remaining_str = str(rem_td)
-                    self.progress_update.emit(percent, remaining_str)
-                if "progress=end" in line:
-                    break
-            process.wait()
-            self.finished.emit(output_file)
-        except Exception as e:
-            self.error.emit(str(e))
+    try:
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+            filename = ydl.prepare_filename(info)
+    except Exception:
+        if quality not in QUALITY_MAP and quality != "Shorts":
+            raise
+        if stop_event is not None and stop_event.is_set():
+            raise
+        # The requested format was unavailable; retry with the best available one
+        ydl_opts['format'] = 'bestvideo+bestaudio/best'
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+            filename = ydl.prepare_filename(info)
+        return _finalize_download(filename, None)
+    return _finalize_download(filename, quality)
+
+def _finalize_download(filename, quality):
+    """
+    Rename a finished download with its quality suffix and return the new path.
+    Qualities other than QUALITY_MAP keys and "Shorts" get " - HIGH RES".
+    """
+    base, ext = os.path.splitext(filename)
+    if quality in QUALITY_MAP:
+        new_file = base + f" - {quality}" + ext
+    elif quality == "Shorts":
+        new_file = base + " - SHORTS" + ext
+    else:
+        new_file = base + " - HIGH RES" + ext
+    # os.replace overwrites an existing target on Windows too, unlike os.rename
+    os.replace(filename, new_file)
+    return new_file
 
 # ---------------------------
-# DownloadThread: Standard YT and Shorts support.
+# DownloadTask: Standard YT and Shorts support, run on a QThreadPool
 # ---------------------------
-class DownloadThread(QThread):
+class DownloadSignals(QObject):
     progress = pyqtSignal(int)
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
-    
-    def __init__(self, url, download_path, quality):
+
+class DownloadTask(QRunnable):
+    def __init__(self, url, download_path, quality, stop_event=None):
         """
         quality: for standard videos: "4k", "2k", "1080p", "720p", "480p"
                  for Shorts: use "Shorts"
+        stop_event: optional threading.Event shared with other tasks; setting it
+        aborts the download at the next yt_dlp progress callback.
         """
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = DownloadSignals()
         self.url = url
         self.download_path = download_path
         self.quality = quality
+        self.stop_event = stop_event
         self.filename = None
 
     def run(self):
-        quality_map = {
-            "4k": "bestvideo[height=2160]+bestaudio/best",
-            "2k": "bestvideo[height=1440]+bestaudio/best",
-            "1080p": "bestvideo[height=1080]+bestaudio/best",
-            "720p": "bestvideo[height=720]+bestaudio/best",
-            "480p": "bestvideo[height=480]+bestaudio/best"
-        }
-        ydl_opts = {
-            'outtmpl': os.path.join(self.download_path, '%(title)s.%(ext)s'),
-            'progress_hooks': [],
-        }
-        def progress_hook(d):
-            if d.get('status') == 'downloading':
-                total = d.get('total_bytes') or d.get('total_bytes_estimate')
-                downloaded = d.get('downloaded_bytes', 0)
-                if total:
-                    percent = int(downloaded / total * 100)
-                    self.progress.emit(percent)
-            elif d.get('status') == 'finished':
-                self.progress.emit(100)
-        ydl_opts['progress_hooks'].append(progress_hook)
-
-        if self.quality == "Shorts":
-            ydl_opts['format'] = 'bestvideo+bestaudio/best'
-        elif self.quality in quality_map:
-            ydl_opts['format'] = quality_map[self.quality]
-        else:
-            ydl_opts['format'] = 'bestvideo+bestaudio/best'
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=True)
-                self.filename = ydl.prepare_filename(info)
-            base, ext = os.path.splitext(self.filename)
-            if self.quality in quality_map:
-                new_file = base + f" - {self.quality}" + ext
-            elif self.quality == "Shorts":
-                new_file = base + " - SHORTS" + ext
-            else:
-                new_file = base + " - HIGH RES" + ext
-            os.rename(self.filename, new_file)
-            self.filename = new_file
-            self.finished.emit(self.filename)
+            self.filename = download_video(self.url, self.download_path, self.quality,
+                                           self.signals.progress.emit, self.stop_event)
+            self.signals.finished.emit(self.filename)
         except Exception as e:
-            if self.quality in quality_map or self.quality == "Shorts":
-                try:
-                    ydl_opts['format'] = 'bestvideo+bestaudio/best'
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        info = ydl.extract_info(self.url, download=True)
-                        self.filename = ydl.prepare_filename(info)
-                    base, ext = os.path.splitext(self.filename)
-                    new_file = base + " - HIGH RES" + ext
-                    os.rename(self.filename, new_file)
-                    self.filename = new_file
-                    self.finished.emit(self.filename)
-                except Exception as e2:
-                    self.error.emit(str(e2))
+            self.signals.error.emit(str(e))
+
+# ---------------------------
+# AsyncDownloadPool: One thread running an asyncio loop for many downloads.
+# ---------------------------
+class AsyncDownloadPool(QThread):
+    progress = pyqtSignal(str, int)  # url, percent
+    finished = pyqtSignal(str, str)  # url, downloaded file
+    error = pyqtSignal(str, str)     # url, error message
+
+    def __init__(self, max_concurrent=8):
+        """
+        max_concurrent: number of yt_dlp downloads allowed to run at once.
+        Signals are emitted from worker threads; Qt queues them to receivers
+        living in the GUI thread.
+        """
+        super().__init__()
+        self.max_concurrent = max_concurrent
+        self.loop = None
+        self.semaphore = None
+        self._executor = None
+        self._ready = threading.Event()
+        # Set by stop(); running downloads abort at their next progress hook
+        self._stop_event = threading.Event()
+
+    def run(self):
+        self._stop_event.clear()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent)
+        self.loop.set_default_executor(self._executor)
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self._ready.clear()
+            # Drop queued downloads and tear down without waiting for running ones;
+            # they abort on their own at the next progress hook (stop event)
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self.loop.close()
+
+    def submit(self, url, download_path, quality):
+        """Schedule a download from any thread; starts the pool if needed."""
+        if not self.isRunning():
+            self.start()
+        self._ready.wait()
+        self.loop.call_soon_threadsafe(self.loop.create_task, self._download(url, download_path, quality))
+
+    def stop(self):
+        """
+        Cancel queued downloads, signal running ones to abort and wait for the
+        loop to close. Running downloads are not waited for, so this returns quickly.
+        """
+        self._stop_event.set()
+        if self.loop is not None and self.isRunning():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.wait()
+
+    async def _download(self, url, download_path, quality):
+        async with self.semaphore:
+            try:
+                file_path = await self.loop.run_in_executor(
+                    None, download_video, url, download_path, quality,
+                    lambda percent: self.progress.emit(url, percent), self._stop_event
+                )
+            except Exception as e:
+                self.error.emit(url, str(e))
             else:
-                self.error.emit(str(e))
+                self.finished.emit(url, file_path)
 
 # ---------------------------
 # BatchDownloadDialog: For batch downloading/conversion of YouTube/Shorts videos.
@@ -324,8 +864,16 @@ class BatchDownloadDialog(QDialog):
         self.is_shorts = is_shorts
         self.setWindowTitle("Batch Download" + (" - Shorts" if is_shorts else " - YouTube"))
         self.urls = []
-        self.current_index = 0
-        self.current_thread = None
+        # Downloads are network-bound and independent, so run several at once
+        self.max_concurrent = 4
+        self.active_count = 0
+        self.downloaded_files = []
+        self.download_pool = AsyncDownloadPool(self.max_concurrent)
+        self.download_pool.finished.connect(self.download_finished)
+        self.download_pool.error.connect(self.download_error)
+        # Downloads keep running after the dialog closes; the main window stops the pool on exit
+        if hasattr(parent, 'download_pools'):
+            parent.download_pools.append(self.download_pool)
 
         layout = QVBoxLayout(self)
 
@@ -363,6 +911,12 @@ class BatchDownloadDialog(QDialog):
         self.start_button.clicked.connect(self.start_batch_download)
         layout.addWidget(self.start_button)
 
+        self.convert_button = QPushButton("Convert Downloaded Files")
+        self.convert_button.clicked.connect(self.start_batch_conversion)
+        self.convert_button.setVisible(False)
+        layout.addWidget(self.convert_button)
+        self.conversion_thread = None
+
         self.progress_list = QListWidget()
         layout.addWidget(self.progress_list)
 
@@ -386,60 +940,123 @@ class BatchDownloadDialog(QDialog):
         else:
             self.selected_quality = "Shorts"
         self.progress_list.addItem(f"Starting batch download of {len(self.urls)} URL(s)...")
-        self.current_index = 0
-        self.start_next_download()
-
-    def start_next_download(self):
-        if self.current_index < len(self.urls):
-            url = self.urls[self.current_index]
+        self.start_button.setEnabled(False)
+        self.convert_button.setVisible(False)
+        self.downloaded_files = []
+        # Hand every URL to the pool at once; it caps how many run concurrently
+        for url in self.urls:
             if not self.is_shorts and "youtube.com/shorts/" in url:
                 url = url.replace("shorts/", "watch?v=")
             self.progress_list.addItem(f"Downloading: {url}")
-            self.current_thread = DownloadThread(url, self.download_directory, self.selected_quality)
-            self.current_thread.finished.connect(self.download_finished)
-            self.current_thread.error.connect(self.download_error)
-            self.current_thread.progress.connect(lambda p: None)
-            self.current_thread.start()
-        else:
+            self.active_count += 1
+            self.download_pool.submit(url, self.download_directory, self.selected_quality)
+
+    def download_done(self):
+        self.active_count -= 1
+        if self.active_count == 0:
             self.progress_list.addItem("Batch download complete.")
+            self.start_button.setEnabled(True)
+            # Warm the ffprobe cache off the GUI thread before any conversion is requested
+            threading.Thread(target=probe_many, args=(list(self.downloaded_files),), daemon=True).start()
+            self.convert_button.setVisible(bool(self.downloaded_files))
 
-    def download_finished(self, file_path):
+    def download_finished(self, url, file_path):
         self.progress_list.addItem(f"Downloaded: {file_path}")
-        if self.parent() and hasattr(self.parent(), 'download_list'):
-            parent = self.parent()
-            parent.download_list.addItem(file_path)
-            parent.recent_downloads.append(file_path)
-            parent.settings.setValue("recent_downloads", parent.recent_downloads)
-        self.current_index += 1
-        self.start_next_download()
+        self.downloaded_files.append(file_path)
+        if self.parent() and hasattr(self.parent(), 'add_recent_download'):
+            self.parent().add_recent_download(file_path)
+        self.download_done()
+
+    def download_error(self, url, error_message):
+        self.progress_list.addItem(f"Error: {url}: {error_message}")
+        self.download_done()
 
-    def download_error(self, error_message):
-        self.progress_list.addItem(f"Error: {error_message}")
-        self.current_index += 1
-        self.start_next_download()
+    def start_batch_conversion(self):
+        if not self.downloaded_files:
+            return
+        conv_type, _ = choose_conversion_parameters(self, self.downloaded_files[0])
+        if conv_type is None:
+            return
+        parent = self.parent()
+        performance_mode = getattr(parent, 'performance_mode', False)
+        force_copy = getattr(parent, 'force_copy', False)
+        self.convert_button.setEnabled(False)
+        self.progress_list.addItem(f"Starting batch conversion of {len(self.downloaded_files)} file(s)...")
+        self.conversion_thread = BatchConversionThread(self.downloaded_files, conv_type, performance_mode, force_copy)
+        self.conversion_thread.file_finished.connect(self.conversion_finished)
+        self.conversion_thread.file_error.connect(self.conversion_error)
+        self.conversion_thread.progress_update.connect(self.conversion_progress)
+        self.conversion_thread.finished.connect(self.batch_conversion_done)
+        self.conversion_thread.start()
+
+    def conversion_finished(self, input_file, output_file):
+        self.progress_list.addItem(f"Converted: {output_file}")
+        if self.parent() and hasattr(self.parent(), 'add_converted_file'):
+            self.parent().add_converted_file(output_file)
+
+    def conversion_error(self, input_file, error_message):
+        self.progress_list.addItem(f"Conversion error: {input_file}: {error_message}")
+
+    def conversion_progress(self, done, total):
+        self.progress_list.addItem(f"{done}/{total} converted")
+
+    def batch_conversion_done(self):
+        self.progress_list.addItem("Batch conversion complete.")
+        self.convert_button.setEnabled(True)
 
 # ---------------------------
 # MainWindow
 # ---------------------------
+# Seconds a file stat stays valid; long enough to cover one context-menu action
+STAT_CACHE_TTL = 2.0
+# Most paths kept in the stat cache; the least recently stat'd one is evicted first
+STAT_CACHE_SIZE = 256
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.settings = QSettings("SewDough", "PySnag")
         self.download_directory = self.settings.value("download_directory", os.path.expanduser("~"))
-        self.recent_downloads = self.settings.value("recent_downloads", [])
-        if not isinstance(self.recent_downloads, list):
-            self.recent_downloads = [self.recent_downloads] if self.recent_downloads else []
-        self.converted_files = self.settings.value("converted_files", [])
-        if not isinstance(self.converted_files, list):
-            self.converted_files = [self.converted_files] if self.converted_files else []
+        self.recent_downloads = self.load_list_setting("recent_downloads")
+        self.converted_files = self.load_list_setting("converted_files")
+        # List settings changed on hot paths are written together by a debounced flush
+        self._settings_dirty = set()
+        self._settings_rewrite = set()
+        # Number of entries of each list already stored in its QSettings array
+        self._settings_written = {"recent_downloads": len(self.recent_downloads),
+                                  "converted_files": len(self.converted_files)}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(500)
+        self._flush_timer.timeout.connect(self._flush_settings)
+        # ffprobe results from earlier sessions; entries are re-checked against file mtime/size
+        try:
+            load_probe_cache(json.loads(self.settings.value("resolution_cache", "{}")))
+        except (TypeError, ValueError, AttributeError):
+            pass
         self.downloaded_file_yt = None
         self.downloaded_file_shorts = None
         self.dark_mode = False
         self.performance_mode = False  # Flag for performance mode
-        # Hold conversion threads to prevent premature destruction
-        self.yt_conversion_thread = None
-        self.shorts_conversion_thread = None
-        self.context_conversion_thread = None
+        self.force_copy = False  # Flag to always remux video instead of re-encoding
+        # path -> (time checked, os.stat_result or None); see _stat
+        self._stat_cache = {}
+        # model -> rows queued by append_to_model, inserted together on the next event-loop pass
+        self._pending_rows = {}
+        # Probe recent videos in the background so the first context menu finds them cached
+        if self.settings.value("precache_metadata", True, type=bool):
+            videos = [p for p in self.recent_downloads if is_video_file(p)]
+            threading.Thread(target=probe_many, args=(videos, 4), daemon=True).start()
+        # Downloads and conversions share a bounded pool so batches cannot oversubscribe the CPU
+        self.pool = QThreadPool(self)
+        default_workers = min(os.cpu_count() or 4, 4)
+        self.pool.setMaxThreadCount(max(1, self.settings.value("max_workers", default_workers, type=int)))
+        # Set on close to abort running downloads at their next progress callback
+        self.stop_event = threading.Event()
+        # Batch download pools, kept running after their dialog closes; stopped in closeEvent
+        self.download_pools = []
+        # id -> pool task still queued or running; see _start_task
+        self._running_tasks = {}
 
         # Main layout: top bar and content area
         main_widget = QWidget()
@@ -459,6 +1076,9 @@ class MainWindow(QMainWindow):
         self.performance_mode_button = QPushButton("Performance Mode: OFF")
         self.performance_mode_button.clicked.connect(self.toggle_performance_mode)
         top_bar.addWidget(self.performance_mode_button)
+        self.force_copy_button = QPushButton("Force Copy: OFF")
+        self.force_copy_button.clicked.connect(self.toggle_force_copy)
+        top_bar.addWidget(self.force_copy_button)
         main_vlayout.addLayout(top_bar)
 
         # Content area: left panel and tabs
@@ -479,13 +1099,20 @@ class MainWindow(QMainWindow):
         recent_header_layout.addWidget(self.clear_recent_button)
         left_panel.addLayout(recent_header_layout)
         
-        self.download_list = QListWidget()
+        # String list models keep one plain string per row instead of a QListWidgetItem
+        self.download_model = QStringListModel(self.recent_downloads)
+        self.download_list = QListView()
+        self.download_list.setModel(self.download_model)
+        self.download_list.setEditTriggers(QListView.NoEditTriggers)
         self.download_list.setMinimumHeight(150)
-        for item in self.recent_downloads:
-            self.download_list.addItem(item)
         self.download_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.download_list.customContextMenuRequested.connect(self.show_context_menu)
-        self.download_list.itemDoubleClicked.connect(self.open_file_item)
+        # Context menus are built once; only the convert label changes per right-click
+        self._dl_menu = QMenu(self)
+        self._dl_open_action = self._dl_menu.addAction("Open File")
+        self._dl_convert_action = self._dl_menu.addAction("Convert")
+        self._dl_location_action = self._dl_menu.addAction("Open File Location")
+        self.download_list.doubleClicked.connect(self.open_file_item)
         left_panel.addWidget(self.download_list)
         
         # Converted Files section
@@ -500,12 +1127,16 @@ class MainWindow(QMainWindow):
         converted_header_layout.addWidget(self.clear_converted_button)
         left_panel.addLayout(converted_header_layout)
         
-        self.converted_list = QListWidget()
+        self.converted_model = QStringListModel(self.converted_files)
+        self.converted_list = QListView()
+        self.converted_list.setModel(self.converted_model)
+        self.converted_list.setEditTriggers(QListView.NoEditTriggers)
         self.converted_list.setMinimumHeight(150)
-        for item in self.converted_files:
-            self.converted_list.addItem(item)
         self.converted_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.converted_list.customContextMenuRequested.connect(self.show_context_menu_converted)
+        self._conv_menu = QMenu(self)
+        self._conv_open_action = self._conv_menu.addAction("Open File")
+        self._conv_location_action = self._conv_menu.addAction("Open File Location")
         left_panel.addWidget(self.converted_list)
         
         # Import and Set Directory buttons
@@ -544,7 +1175,7 @@ class MainWindow(QMainWindow):
         self.yt_conversion_progress_bar.setRange(0, 0)
         yt_layout.addWidget(self.yt_conversion_progress_bar)
         self.yt_convert_button = QPushButton("Convert")
-        self.yt_convert_button.clicked.connect(self.start_conversion_yt)
+        self.yt_convert_button.clicked.connect(lambda: self._start_conversion("yt", self.downloaded_file_yt))
         self.yt_convert_button.setVisible(False)
         yt_layout.addWidget(self.yt_convert_button)
         self.yt_conversion_status = QLabel("")
@@ -571,16 +1202,147 @@ class MainWindow(QMainWindow):
         self.shorts_conversion_progress_bar.setRange(0, 0)
         shorts_layout.addWidget(self.shorts_conversion_progress_bar)
         self.shorts_convert_button = QPushButton("Convert")
-        self.shorts_convert_button.clicked.connect(self.start_conversion_shorts)
+        self.shorts_convert_button.clicked.connect(lambda: self._start_conversion("shorts", self.downloaded_file_shorts))
         self.shorts_convert_button.setVisible(False)
         shorts_layout.addWidget(self.shorts_convert_button)
         self.shorts_conversion_status = QLabel("")
         shorts_layout.addWidget(self.shorts_conversion_status)
         self.tab_widget.addTab(self.shorts_tab, "Shorts Downloader")
 
+        # Conversion mode -> (convert button, progress bar, status label); context-menu conversions have no widgets
+        self._conv_slots = {
+            "yt": (self.yt_convert_button, self.yt_conversion_progress_bar, self.yt_conversion_status),
+            "shorts": (self.shorts_convert_button, self.shorts_conversion_progress_bar, self.shorts_conversion_status),
+            "context": (None, None, None),
+        }
+        # mode -> time.monotonic() of the last progress repaint; see _update_conversion_status
+        self._last_conversion_ui = {"yt": 0.0, "shorts": 0.0}
+
         self.setWindowTitle("PySnag v0.3a by SewDough")
         self.resize(900, 500)
 
+    # ------------- Settings Helpers -------------
+    def load_list_setting(self, key):
+        """
+        Read a list stored as a QSettings array (one entry per index), so an
+        append only has to write the new entry. Older single-value storage
+        (a JSON string or a plain list) is migrated on first read.
+        """
+        size = self.settings.beginReadArray(key)
+        items = []
+        for i in range(size):
+            self.settings.setArrayIndex(i)
+            items.append(self.settings.value("path", ""))
+        self.settings.endArray()
+        if size or self.settings.value(key) is None:
+            return items
+        raw = self.settings.value(key)
+        try:
+            items = json.loads(raw)
+        except (TypeError, ValueError):
+            if isinstance(raw, list):
+                items = raw
+            else:
+                items = [raw] if raw else []
+        self.settings.remove(key)
+        self.write_list_setting(key, items, 0)
+        return items
+
+    def write_list_setting(self, key, values, start):
+        """Write values into the QSettings array key starting at index start."""
+        self.settings.beginWriteArray(key, start + len(values))
+        for offset, value in enumerate(values):
+            self.settings.setArrayIndex(start + offset)
+            self.settings.setValue("path", value)
+        self.settings.endArray()
+
+    def _start_task(self, task):
+        """
+        Start a pool task (autoDelete off) and keep it alive until it reports back.
+        The pool does not own such tasks, so dropping the last Python reference
+        while one is still queued would free it under the pool.
+        """
+        key = id(task)
+        self._running_tasks[key] = task
+        # Connected last so every other slot runs while the task is still referenced
+        task.signals.finished.connect(partial(self._task_done, key))
+        task.signals.error.connect(partial(self._task_done, key))
+        self.pool.start(task)
+
+    def _task_done(self, key, *args):
+        self._running_tasks.pop(key, None)
+
+    def _stat(self, path):
+        """
+        Return os.stat_result for path, or None if it does not exist.
+        One stat serves a whole user action (menu open, then open/convert),
+        so results are reused for STAT_CACHE_TTL seconds.
+        """
+        now = time.monotonic()
+        cached = self._stat_cache.pop(path, None)
+        if cached is not None and now - cached[0] < STAT_CACHE_TTL:
+            self._stat_cache[path] = cached
+            return cached[1]
+        try:
+            st = os.stat(path, follow_symlinks=False)
+        except (OSError, ValueError):
+            st = None
+        if len(self._stat_cache) >= STAT_CACHE_SIZE:
+            del self._stat_cache[next(iter(self._stat_cache))]
+        self._stat_cache[path] = (now, st)
+        return st
+
+    def append_to_model(self, model, text):
+        """Queue a row; rows appended in the same burst (e.g. a batch) are inserted in one go."""
+        pending = self._pending_rows.setdefault(model, [])
+        if not pending:
+            QTimer.singleShot(0, partial(self._insert_pending_rows, model))
+        pending.append(text)
+
+    def _insert_pending_rows(self, model):
+        rows = self._pending_rows.pop(model, None)
+        if not rows:
+            return
+        start = model.rowCount()
+        model.insertRows(start, len(rows))
+        for offset, text in enumerate(rows):
+            model.setData(model.index(start + offset), text)
+
+    def _schedule_flush(self, key, rewrite=False):
+        """
+        Mark a list setting (named after its attribute) dirty and flush it shortly.
+        rewrite=True rewrites the whole array, e.g. after the list was cleared;
+        otherwise only entries appended since the last flush are written.
+        """
+        self._settings_dirty.add(key)
+        if rewrite:
+            self._settings_rewrite.add(key)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_settings(self):
+        for key in self._settings_dirty:
+            values = getattr(self, key)
+            written = self._settings_written.get(key, 0)
+            if key in self._settings_rewrite or written > len(values):
+                self.settings.remove(key)
+                written = 0
+            self.write_list_setting(key, values[written:], written)
+            self._settings_written[key] = len(values)
+        self._settings_dirty.clear()
+        self._settings_rewrite.clear()
+        self.settings.sync()
+
+    def closeEvent(self, event):
+        self.stop_event.set()
+        for pool in self.download_pools:
+            pool.stop()
+        self._flush_timer.stop()
+        self._flush_settings()
+        probed = export_probe_cache(self.recent_downloads + self.converted_files)
+        self.settings.setValue("resolution_cache", json.dumps(probed))
+        super().closeEvent(event)
+
     # ------------- Toggle Stylesheets -------------
     def toggle_dark_mode(self):
         if not self.dark_mode:
@@ -665,16 +1427,27 @@ class MainWindow(QMainWindow):
         else:
             self.performance_mode_button.setText("Performance Mode: OFF")
 
+    def toggle_force_copy(self):
+        self.force_copy = not self.force_copy
+        if self.force_copy:
+            self.force_copy_button.setText("Force Copy: ON")
+        else:
+            self.force_copy_button.setText("Force Copy: OFF")
+
     # ------------- Clear List Functions -------------
     def clear_recent_downloads(self):
-        self.download_list.clear()
+        self._pending_rows.pop(self.download_model, None)
+        self._stat_cache.clear()
+        self.download_model.setStringList([])
         self.recent_downloads = []
-        self.settings.setValue("recent_downloads", self.recent_downloads)
+        self._schedule_flush("recent_downloads", rewrite=True)
 
     def clear_converted_files(self):
-        self.converted_list.clear()
+        self._pending_rows.pop(self.converted_model, None)
+        self._stat_cache.clear()
+        self.converted_model.setStringList([])
         self.converted_files = []
-        self.settings.setValue("converted_files", self.converted_files)
+        self._schedule_flush("converted_files", rewrite=True)
 
     # ------------- Context Menus and Buttons -------------
     def set_directory(self):
@@ -684,58 +1457,47 @@ class MainWindow(QMainWindow):
             self.settings.setValue("download_directory", directory)
 
     def import_file(self):
-        # Filter for accepted video and audio types
-        file_filter = "Video Files (*.mp4 *.avi *.mkv *.webm *.mov);;Audio Files (*.mp3 *.wav *.aiff *.flac)"
-        file_path, _ = QFileDialog.getOpenFileName(self, "Import File for Conversion", "", file_filter)
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import File for Conversion", "", IMPORT_FILE_FILTER)
         if file_path and os.path.exists(file_path):
-            self.recent_downloads.append(file_path)
-            self.download_list.addItem(file_path)
-            self.settings.setValue("recent_downloads", self.recent_downloads)
+            self.add_recent_download(file_path)
 
     def show_context_menu(self, position):
-        item = self.download_list.itemAt(position)
-        if item is None:
+        index = self.download_list.indexAt(position)
+        if not index.isValid():
             return
-        menu = QMenu()
-        open_action = menu.addAction("Open File")
-        file_path = item.text() if hasattr(item, 'text') else item
-        if file_path.lower().endswith(('.mp4', '.avi', '.mkv', '.webm', '.mov')):
-            res = get_video_resolution(file_path)
+        file_path = index.data()
+        convert_text = "Convert"
+        if is_video_file(file_path):
+            st = self._stat(file_path)
+            res = probe_video(file_path, st)[0] if st is not None else None
             if res is not None:
                 if res < 1080:
                     convert_text = "Convert (Upscale)"
                 else:
                     convert_text = "Convert (No Scaling)"
-            else:
-                convert_text = "Convert"
-            convert_action = menu.addAction(convert_text)
-        else:
-            convert_action = menu.addAction("Convert")
-        location_action = menu.addAction("Open File Location")
-        action = menu.exec_(self.download_list.viewport().mapToGlobal(position))
-        if action == open_action:
-            self.open_file_item(item)
-        elif action == convert_action:
-            self.context_convert(item.text())
-        elif action == location_action:
-            self.open_file_location(item.text())
+        self._dl_convert_action.setText(convert_text)
+        action = self._dl_menu.exec_(self.download_list.viewport().mapToGlobal(position))
+        if action == self._dl_open_action:
+            self.open_file_item(file_path)
+        elif action == self._dl_convert_action:
+            self._start_conversion("context", file_path)
+        elif action == self._dl_location_action:
+            self.open_file_location(file_path)
 
     def show_context_menu_converted(self, position):
-        item = self.converted_list.itemAt(position)
-        if item is None:
+        index = self.converted_list.indexAt(position)
+        if not index.isValid():
             return
-        menu = QMenu()
-        open_action = menu.addAction("Open File")
-        location_action = menu.addAction("Open File Location")
-        action = menu.exec_(self.converted_list.viewport().mapToGlobal(position))
-        if action == open_action:
-            self.open_file_item(item)
-        elif action == location_action:
-            self.open_file_location(item.text())
+        file_path = index.data()
+        action = self._conv_menu.exec_(self.converted_list.viewport().mapToGlobal(position))
+        if action == self._conv_open_action:
+            self.open_file_item(file_path)
+        elif action == self._conv_location_action:
+            self.open_file_location(file_path)
 
     def open_file_item(self, item):
-        file_path = item.text() if hasattr(item, 'text') else item
-        if os.path.exists(file_path):
+        file_path = item.data() if hasattr(item, 'data') else item
+        if self._stat(file_path) is not None:
             try:
                 os.startfile(file_path)
             except Exception as e:
@@ -743,33 +1505,30 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.critical(self, "Error", "File does not exist.")
 
-    def context_convert(self, file_path):
-        if not os.path.exists(file_path):
-            QMessageBox.critical(self, "Error", "File does not exist.")
-            return
-        conv_type = choose_conversion_parameters(self, file_path)
-        if conv_type is None:
-            return
-        self.context_conversion_thread = ConversionThread(file_path, conv_type, performance_mode=self.performance_mode)
-        self.context_conversion_thread.progress_update.connect(lambda pct, rem: None)
-        self.context_conversion_thread.finished.connect(lambda output: self._conversion_finished("context", output))
-        self.context_conversion_thread.error.connect(lambda err: self._conversion_error("context", err))
-        self.context_conversion_thread.start()
-
     def open_file_location(self, file_path):
-        if os.path.exists(file_path):
+        if self._stat(file_path) is not None:
             try:
-                subprocess.Popen(["explorer", "/select,", os.path.normpath(file_path)])
+                subprocess.Popen(["explorer", "/select,", os.path.normpath(file_path)],
+                                 close_fds=True, creationflags=_DETACHED,
+                                 stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Could not open file location: {e}")
         else:
             QMessageBox.critical(self, "Error", "File does not exist.")
 
-    # ------------- Utility: Add Converted File -------------
+    # ------------- Utility: Add Recent Download / Converted File -------------
+    def add_recent_download(self, file_path):
+        self._stat_cache.pop(file_path, None)
+        self.append_to_model(self.download_model, file_path)
+        self.recent_downloads.append(file_path)
+        self._schedule_flush("recent_downloads")
+
     def add_converted_file(self, file_path):
-        self.converted_list.addItem(file_path)
+        self._stat_cache.pop(file_path, None)
+        self.append_to_model(self.converted_model, file_path)
         self.converted_files.append(file_path)
-        self.settings.setValue("converted_files", self.converted_files)
+        self._schedule_flush("converted_files")
 
     # ------------- YouTube Video Support -------------
     def start_download_yt(self):
@@ -786,17 +1545,15 @@ class MainWindow(QMainWindow):
         self.yt_download_button.setEnabled(False)
         self.yt_progress_bar.setValue(0)
         self.yt_convert_button.setVisible(False)
-        self.yt_download_thread = DownloadThread(url, self.download_directory, quality)
-        self.yt_download_thread.progress.connect(self.yt_progress_bar.setValue)
-        self.yt_download_thread.finished.connect(self.yt_download_finished)
-        self.yt_download_thread.error.connect(self.yt_download_error)
-        self.yt_download_thread.start()
+        task = DownloadTask(url, self.download_directory, quality, self.stop_event)
+        task.signals.progress.connect(self.yt_progress_bar.setValue)
+        task.signals.finished.connect(self.yt_download_finished)
+        task.signals.error.connect(self.yt_download_error)
+        self._start_task(task)
 
     def yt_download_finished(self, file_path):
         self.downloaded_file_yt = file_path
-        self.recent_downloads.append(file_path)
-        self.download_list.addItem(file_path)
-        self.settings.setValue("recent_downloads", self.recent_downloads)
+        self.add_recent_download(file_path)
         self.yt_download_button.setEnabled(True)
         self.yt_convert_button.setVisible(True)
         QMessageBox.information(self, "Download Complete", f"File downloaded:\n{file_path}")
@@ -805,55 +1562,55 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(self, "Download Error", error_message)
         self.yt_download_button.setEnabled(True)
 
-    def start_conversion_yt(self):
-        file_path = self.downloaded_file_yt
+    # ------------- Conversion (YouTube, Shorts and context menu) -------------
+    def _start_conversion(self, mode, file_path):
         if not file_path:
             QMessageBox.warning(self, "Conversion Error", "No file available for conversion.")
             return
-        conv_type = choose_conversion_parameters(self, file_path)
+        if self._stat(file_path) is None:
+            QMessageBox.critical(self, "Error", "File does not exist.")
+            return
+        conv_type, source_res = choose_conversion_parameters(self, file_path)
         if conv_type is None:
             return
-        self.yt_convert_button.setEnabled(False)
-        self.yt_conversion_progress_bar.setRange(0, 0)
-        self.yt_conversion_status.setText("")
-        self.yt_conversion_thread = ConversionThread(file_path, conv_type, performance_mode=self.performance_mode)
-        self.yt_conversion_thread.progress_update.connect(self.update_yt_conversion_status)
-        self.yt_conversion_thread.finished.connect(lambda output: self._conversion_finished("yt", output))
-        self.yt_conversion_thread.error.connect(lambda err: self._conversion_error("yt", err))
-        self.yt_conversion_thread.start()
-
-    def update_yt_conversion_status(self, percent, remaining):
-        if self.yt_conversion_progress_bar.maximum() == 0:
-            self.yt_conversion_progress_bar.setRange(0, 100)
-        self.yt_conversion_progress_bar.setValue(percent)
-        self.yt_conversion_status.setText(f"{percent}% completed, Time remaining: {remaining}")
+        button, progress_bar, status_label = self._conv_slots[mode]
+        task = ConversionTask(file_path, conv_type, performance_mode=self.performance_mode,
+                              force_copy=self.force_copy, source_resolution=source_res)
+        if button is not None:
+            button.setEnabled(False)
+            progress_bar.setRange(0, 0)
+            status_label.setText("")
+            task.signals.progress_update.connect(partial(self._update_conversion_status, mode))
+        task.signals.finished.connect(partial(self._conversion_finished, mode))
+        task.signals.error.connect(partial(self._conversion_error, mode))
+        self._start_task(task)
+
+    def _update_conversion_status(self, mode, percent, remaining):
+        # Repaint at most 10 times a second, but always draw the final 100%
+        now = time.monotonic()
+        if percent < 100 and now - self._last_conversion_ui[mode] < 0.1:
+            return
+        self._last_conversion_ui[mode] = now
+        _, progress_bar, status_label = self._conv_slots[mode]
+        if progress_bar.maximum() == 0:
+            progress_bar.setRange(0, 100)
+        progress_bar.setValue(percent)
+        status_label.setText(f"{percent}% completed, Time remaining: {remaining}")
 
     def _conversion_finished(self, mode, output):
         QMessageBox.information(self, "Conversion Complete", f"File converted:\n{output}")
         self.add_converted_file(output)
-        if mode == "yt":
-            self.yt_convert_button.setEnabled(True)
-            self.yt_conversion_status.setText("Conversion complete.")
-            self.yt_conversion_thread = None
-        elif mode == "shorts":
-            self.shorts_convert_button.setEnabled(True)
-            self.shorts_conversion_status.setText("Conversion complete.")
-            self.shorts_conversion_thread = None
-        elif mode == "context":
-            self.context_conversion_thread = None
+        button, _, status_label = self._conv_slots[mode]
+        if button is not None:
+            button.setEnabled(True)
+            status_label.setText("Conversion complete.")
 
     def _conversion_error(self, mode, error_message):
         QMessageBox.critical(self, "Conversion Error", error_message)
-        if mode == "yt":
-            self.yt_convert_button.setEnabled(True)
-            self.yt_conversion_status.setText("")
-            self.yt_conversion_thread = None
-        elif mode == "shorts":
-            self.shorts_convert_button.setEnabled(True)
-            self.shorts_conversion_status.setText("")
-            self.shorts_conversion_thread = None
-        elif mode == "context":
-            self.context_conversion_thread = None
+        button, _, status_label = self._conv_slots[mode]
+        if button is not None:
+            button.setEnabled(True)
+            status_label.setText("")
 
     # ------------- YT Shorts Support -------------
     def start_download_shorts(self):
@@ -864,17 +1621,15 @@ class MainWindow(QMainWindow):
         self.shorts_download_button.setEnabled(False)
         self.shorts_progress_bar.setValue(0)
         self.shorts_convert_button.setVisible(False)
-        self.shorts_download_thread = DownloadThread(url, self.download_directory, "Shorts")
-        self.shorts_download_thread.progress.connect(self.shorts_progress_bar.setValue)
-        self.shorts_download_thread.finished.connect(self.shorts_download_finished)
-        self.shorts_download_thread.error.connect(self.shorts_download_error)
-        self.shorts_download_thread.start()
+        task = DownloadTask(url, self.download_directory, "Shorts", self.stop_event)
+        task.signals.progress.connect(self.shorts_progress_bar.setValue)
+        task.signals.finished.connect(self.shorts_download_finished)
+        task.signals.error.connect(self.shorts_download_error)
+        self._start_task(task)
 
     def shorts_download_finished(self, file_path):
         self.downloaded_file_shorts = file_path
-        self.recent_downloads.append(file_path)
-        self.download_list.addItem(file_path)
-        self.settings.setValue("recent_downloads", self.recent_downloads)
+        self.add_recent_download(file_path)
         self.shorts_download_button.setEnabled(True)
         self.shorts_convert_button.setVisible(True)
         QMessageBox.information(self, "Download Complete", f"File downloaded:\n{file_path}")
@@ -883,29 +1638,6 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(self, "Download Error", error_message)
         self.shorts_download_button.setEnabled(True)
 
-    def start_conversion_shorts(self):
-        file_path = self.downloaded_file_shorts
-        if not file_path:
-            QMessageBox.warning(self, "Conversion Error", "No file available for conversion.")
-            return
-        conv_type = choose_conversion_parameters(self, file_path)
-        if conv_type is None:
-            return
-        self.shorts_convert_button.setEnabled(False)
-        self.shorts_conversion_progress_bar.setRange(0, 0)
-        self.shorts_conversion_status.setText("")
-        self.shorts_conversion_thread = ConversionThread(file_path, conv_type, performance_mode=self.performance_mode)
-        self.shorts_conversion_thread.progress_update.connect(self.update_shorts_conversion_status)
-        self.shorts_conversion_thread.finished.connect(lambda output: self._conversion_finished("shorts", output))
-        self.shorts_conversion_thread.error.connect(lambda err: self._conversion_error("shorts", err))
-        self.shorts_conversion_thread.start()
-
-    def update_shorts_conversion_status(self, percent, remaining):
-        if self.shorts_conversion_progress_bar.maximum() == 0:
-            self.shorts_conversion_progress_bar.setRange(0, 100)
-        self.shorts_conversion_progress_bar.setValue(percent)
-        self.shorts_conversion_status.setText(f"{percent}% completed, Time remaining: {remaining}")
-
     # ------------- Batch Download Handlers -------------
     def start_batch_download_yt(self):
         dialog = BatchDownloadDialog(self, self.download_directory, is_shorts=False)
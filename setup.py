@@ -2,35 +2,73 @@ import os
 import sys
 import subprocess
 import configparser
+import importlib.util
+import shutil
 import urllib.request
 import zipfile
 
+# 1 MB buffers for the ffmpeg download and extraction: few large reads and writes
+CHUNK_SIZE = 1 << 20
+# Redraw the download progress roughly every 4 MB instead of on every chunk
+PROGRESS_STEP = 1 << 22
+
+# pip package name -> importable module name
+DEPENDENCIES = {'PyQt5': 'PyQt5', 'pytube': 'pytube', 'yt-dlp': 'yt_dlp'}
+
 def install_dependencies():
+    if all(importlib.util.find_spec(module) for module in DEPENDENCIES.values()):
+        print("Dependencies already installed.")
+        return
     print("Installing dependencies via pip...")
-    subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'PyQt5', 'pytube', 'yt-dlp'])
+    subprocess.check_call([sys.executable, '-m', 'pip', 'install',
+                           '--prefer-binary', '--only-binary=:all:', '--disable-pip-version-check',
+                           '--no-input', '--no-warn-script-location', *DEPENDENCIES])
 
 def ffmpeg_in_path():
-    try:
-        subprocess.check_output(['ffmpeg', '-version'], stderr=subprocess.STDOUT)
-        print("ffmpeg is already in your PATH.")
-        return True
-    except Exception:
-        print("ffmpeg not found in PATH.")
-        return False
+    # PATH lookup first (no process spawn); only run the binary once it has been found
+    ffmpeg_path = shutil.which('ffmpeg')
+    if ffmpeg_path:
+        try:
+            subprocess.run([ffmpeg_path, '-version'], capture_output=True, timeout=10, check=True)
+            print("ffmpeg is already in your PATH.")
+            return True
+        except Exception:
+            pass
+    print("ffmpeg not found in PATH.")
+    return False
 
 def progress_hook(block_num, block_size, total_size):
     downloaded = block_num * block_size
     if total_size > 0:
-        percent = downloaded / total_size * 100
+        percent = min(downloaded / total_size * 100, 100.0)
         sys.stdout.write(f"\rDownloading ffmpeg: {percent:5.1f}%")
         sys.stdout.flush()
 
+# Only the two binaries the app runs, plus the licence files that must ship with them
+NEEDED_MEMBERS = frozenset({'bin/ffmpeg.exe', 'bin/ffprobe.exe', 'LICENSE', 'README.txt'})
+
 def download_and_extract_ffmpeg():
     url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
     dest_zip = "ffmpeg.zip"
     print(f"Downloading ffmpeg from {url} (this may take a while)...")
     try:
-        urllib.request.urlretrieve(url, dest_zip, reporthook=progress_hook)
+        # identity encoding keeps Content-Length meaningful for the progress display
+        request = urllib.request.Request(url, headers={'Accept-Encoding': 'identity', 'Connection': 'keep-alive'})
+        with urllib.request.urlopen(request) as response, open(dest_zip, 'wb', buffering=CHUNK_SIZE) as f:
+            total_size = int(response.headers.get('Content-Length') or 0)
+            block_num = 0
+            downloaded = last_reported = 0
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                block_num += 1
+                downloaded += len(chunk)
+                if downloaded - last_reported > PROGRESS_STEP:
+                    progress_hook(block_num, CHUNK_SIZE, total_size)
+                    last_reported = downloaded
+            progress_hook(block_num, CHUNK_SIZE, total_size)
         sys.stdout.write("\n")
     except Exception as e:
         print("Error downloading ffmpeg:", e)
@@ -41,8 +79,18 @@ def download_and_extract_ffmpeg():
         os.makedirs(extract_dir)
     print("Download complete. Extracting ffmpeg...")
     try:
-        with zipfile.ZipFile(dest_zip, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
+        with zipfile.ZipFile(dest_zip, 'r', allowZip64=True) as zip_ref:
+            for info in zip_ref.infolist():
+                # Members sit under a versioned top-level folder, e.g. ffmpeg-7.1-essentials_build/bin/ffmpeg.exe
+                if info.filename.split('/', 1)[-1] not in NEEDED_MEMBERS:
+                    continue
+                target = os.path.realpath(os.path.join(extract_dir, info.filename))
+                # Skip entries that would land outside extract_dir
+                if not target.startswith(os.path.realpath(extract_dir) + os.sep):
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with zip_ref.open(info) as src, open(target, 'wb', buffering=CHUNK_SIZE) as dst:
+                    shutil.copyfileobj(src, dst, length=CHUNK_SIZE)
     except Exception as e:
         print("Error extracting ffmpeg:", e)
         return None
@@ -60,10 +108,36 @@ def download_and_extract_ffmpeg():
     print("Could not locate ffmpeg bin folder in the extracted files.")
     return None
 
+# Encoders the app cares about; recorded so it can skip its own ffmpeg -encoders probe
+ENCODER_WHITELIST = ('h264_nvenc', 'hevc_nvenc', 'h264_qsv', 'hevc_qsv', 'libx264', 'libx265')
+
+def probe_ffmpeg():
+    """
+    Return (absolute path, version, comma-separated whitelisted encoders) for
+    the ffmpeg on PATH, or None if it is missing or does not run.
+    """
+    ffmpeg_path = shutil.which('ffmpeg')
+    if not ffmpeg_path:
+        return None
+    try:
+        version = subprocess.run([ffmpeg_path, '-version'], capture_output=True, timeout=10, check=True)
+        encoders = subprocess.run([ffmpeg_path, '-hide_banner', '-encoders'], capture_output=True, timeout=10, check=True)
+    except Exception:
+        return None
+    # First line reads "ffmpeg version <version> Copyright ..."
+    words = version.stdout.decode('ascii', 'ignore').split()
+    listed = set(encoders.stdout.decode('ascii', 'ignore').split())
+    return (os.path.abspath(ffmpeg_path), words[2] if len(words) > 2 else '',
+            ','.join(name for name in ENCODER_WHITELIST if name in listed))
+
 def write_config(ffmpeg_dir):
     config = configparser.ConfigParser()
     config['FFmpeg'] = {}
     config['FFmpeg']['path'] = ffmpeg_dir if ffmpeg_dir else ''
+    # Only record capabilities that were actually probed; the app probes for itself otherwise
+    probed = probe_ffmpeg()
+    if probed:
+        config['FFmpeg']['executable'], config['FFmpeg']['version'], config['FFmpeg']['encoders'] = probed
     with open('config.ini', 'w') as configfile:
         config.write(configfile)
     print("Configuration saved to config.ini.")
@@ -93,16 +167,9 @@ if __name__ == '__main__':
         else:
             print("Automatic ffmpeg download is only supported on Windows. Please install ffmpeg and add it to your PATH manually.")
     else:
-        # If ffmpeg is in PATH, get its directory using the 'where' command (Windows) or 'which' (Unix)
-        try:
-            if sys.platform.startswith('win'):
-                ffmpeg_dir = subprocess.check_output(['where', 'ffmpeg']).decode().splitlines()[0]
-                ffmpeg_dir = os.path.dirname(ffmpeg_dir)
-            else:
-                ffmpeg_dir = subprocess.check_output(['which', 'ffmpeg']).decode().strip()
-                ffmpeg_dir = os.path.dirname(ffmpeg_dir)
-        except Exception:
-            ffmpeg_dir = ''
+        # If ffmpeg is in PATH, record its directory
+        ffmpeg_path = shutil.which('ffmpeg')
+        ffmpeg_dir = os.path.dirname(ffmpeg_path) if ffmpeg_path else ''
 
     write_config(ffmpeg_dir if ffmpeg_dir else '')
     print("Setup complete. You can now run the main application (e.g., pysnag.py).")